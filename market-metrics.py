@@ -1,26 +1,243 @@
-import yfinance as yf
-import fredapi
+import numpy as np
 import pandas as pd
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from datetime import datetime, timedelta
 import os
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Callable, Tuple, Union
 from rich import print as rprint
 from rich.console import Console
 from rich.panel import Panel
 from rich.table import Table
-import questionary
-from rich.live import Live
-from rich.spinner import Spinner
 import time
 import logging
-import importlib
-import sys
-import subprocess
+import importlib.util
+import collections
 import csv
+import io
+import threading
+import functools
+import itertools
+import hashlib
+import json
+import pickle
+import tempfile
+import copy
+import contextlib
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+# Spreadsheets published by Robert Shiller (CAPE) and Aswath Damodaran (implied ERP)
+SHILLER_URL = "http://www.econ.yale.edu/~shiller/data/ie_data.xls"
+DAMODARAN_URL = "https://pages.stern.nyu.edu/~adamodar/pc/implprem/ERPbymonth.xlsx"
+
+# FRED series read by the metric methods, warmed together by prefetch() (called by
+# get_all_metrics and export_all_metrics_to_csv)
+FRED_SERIES_IDS = ('BAA', 'DGS10', 'GDP', 'A191RL1Q225SBEA', 'GFDEBTN', 'FYFSD',
+                   'CPIAUCSL', 'CP', 'DDDM01USA156NWDB')
+
+# Days of history requested per FRED series; enough to cover the publication lag plus
+# the observations each metric needs. Series not listed are fetched in full.
+FRED_LOOKBACK_DAYS = {
+    'DGS10': 30,             # daily, latest value only
+    'BAA': 120,              # monthly, latest value only
+    'GDP': 400,              # quarterly, published about a month after quarter end
+    'A191RL1Q225SBEA': 400,  # quarterly
+    'GFDEBTN': 400,          # quarterly
+    'FYFSD': 800,            # annual (fiscal year)
+    'CPIAUCSL': 500,         # monthly, 13 observations for the YoY change
+    'CP': 730,               # quarterly, 5 observations for the YoY change
+}
+
+# On-disk cache location and lifetimes (in seconds) for each kind of data
+CACHE_DIR = os.path.join(os.path.expanduser("~"), ".market_metrics_cache")
+YAHOO_CACHE_TTL = 60 * 60
+FRED_CACHE_TTL = 24 * 60 * 60
+DOWNLOAD_CACHE_TTL = 7 * 24 * 60 * 60
+
+# Lifetime (in seconds) of FRED series kept in memory by a long-running session
+FRED_MEMORY_TTL = 6 * 60 * 60
+
+# Lifetime (in seconds) of the parsed Shiller rows kept in memory by a long-running session
+SHILLER_MEMORY_TTL = 6 * 60 * 60
+
+# Lifetime (in seconds) of assembled metric results reused by get_metric_by_name
+METRIC_MEMORY_TTL = 30 * 60
+
+# Number of trailing spreadsheet rows searched for the latest Shiller/Damodaran value
+EXCEL_TAIL_ROWS = 36
+
+# Display metric names mapped to the normalized names used as get_all_metrics keys
+METRIC_SHORT_NAMES = {
+    'US P/E Ratio': 'pe_ratio',
+    'US CAPE Ratio': 'cape_ratio',
+    'US Credit Spreads': 'credit_spreads',
+    'US Stock Market / GDP': 'market_to_gdp',
+    'US GDP': 'gdp',
+    'US Government Debt & Deficit': 'government',
+    'US 10-Year Yield': '10yr_yield',
+    'US Inflation Rate': 'inflation_rate',
+    'US Equity Risk Premium': 'equity_risk_premium',
+    'US Earnings Growth': 'earnings_growth',
+    'Gold Price': 'gold_price',
+    'Bitcoin Price': 'bitcoin_price',
+    'WTI Crude Oil Price': 'wti_crude_price'
+}
+
+# Columns of the CSV export file
+CSV_FIELDNAMES = ['metric', 'sub_metric', 'value', 'timestamp', 'source', 'retrieval_time']
+
+# Shared console for all CLI output; creating a Console probes the terminal each time
+_CONSOLE = Console()
+
+# Header style and (title, style) columns of the metric result table
+RESULT_HEADER_STYLE = "bold magenta"
+RESULT_COLUMNS = (
+    ("Metric", "cyan"),
+    ("Value", "green"),
+    ("As of Date", "yellow"),
+    ("Source", "blue"),
+)
+
+
+def _csv_line(row) -> str:
+    """Format one row like csv.writer does, only invoking it for fields that need quoting"""
+    fields = ['' if value is None else str(value) for value in row]
+    if any(',' in f or '"' in f or '\n' in f or '\r' in f for f in fields):
+        out = io.StringIO()
+        csv.writer(out).writerow(fields)
+        return out.getvalue()
+    return ','.join(fields) + '\r\n'
+
+
+@functools.lru_cache(maxsize=None)
+def _yf():
+    """Import yfinance on first use; importing it pulls in numpy, lxml and bs4"""
+    import yfinance
+    return yfinance
+
+
+class FileCache:
+    """
+    Persistent cache of values with a per-entry time-to-live
+    
+    Entries live at {root}/{kind}/{md5(key)} with a JSON sidecar holding the
+    write time, TTL and storage format. pandas Series are stored as plain numpy
+    arrays (.npz); anything else is pickled (.pkl).
+    """
+    
+    def __init__(self, root: str = CACHE_DIR):
+        """
+        Args:
+            root: Directory the cache entries are stored under
+        """
+        self.root = root
+    
+    def _base_path(self, kind: str, key: str) -> str:
+        """Return the entry path without extension"""
+        digest = hashlib.md5(key.encode('utf-8')).hexdigest()
+        return os.path.join(self.root, kind, digest)
+    
+    def get(self, kind: str, key: str) -> Optional[Any]:
+        """
+        Load a cached value
+        
+        Args:
+            kind: Cache namespace (e.g. 'fred', 'download')
+            key: Identifier of the cached value
+            
+        Returns:
+            The cached value, or None if it is missing, expired or unreadable
+        """
+        base = self._base_path(kind, key)
+        try:
+            with open(f"{base}.json", 'r') as f:
+                meta = json.load(f)
+            if time.time() - meta['ts'] > meta['ttl']:
+                return None
+            
+            if meta.get('format') == 'series':
+                with np.load(f"{base}.npz", allow_pickle=False) as arrays:
+                    return pd.Series(arrays['values'], index=pd.Index(arrays['index']))
+            
+            with open(f"{base}.pkl", 'rb') as f:
+                return pickle.load(f)
+        except (OSError, ValueError, KeyError, EOFError, pickle.UnpicklingError):
+            return None
+    
+    def set(self, kind: str, key: str, value: Any, ttl: int) -> None:
+        """
+        Store a value in the cache
+        
+        Args:
+            kind: Cache namespace (e.g. 'fred', 'download')
+            key: Identifier of the cached value
+            value: pandas Series or other picklable value to store
+            ttl: Lifetime of the entry in seconds
+        """
+        base = self._base_path(kind, key)
+        try:
+            os.makedirs(os.path.dirname(base), exist_ok=True)
+            
+            if isinstance(value, pd.Series):
+                # Raw arrays are smaller and faster to load than a pickled Series
+                buffer = io.BytesIO()
+                np.savez(buffer, values=value.to_numpy(), index=value.index.to_numpy())
+                self._atomic_write(f"{base}.npz", buffer.getvalue())
+                storage_format = 'series'
+            else:
+                self._atomic_write(f"{base}.pkl", pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL))
+                storage_format = 'pickle'
+            
+            meta = {'ts': time.time(), 'ttl': ttl, 'format': storage_format}
+            self._atomic_write(f"{base}.json", json.dumps(meta).encode('utf-8'))
+        except (OSError, ValueError, pickle.PicklingError) as e:
+            logging.getLogger('USMarketMetrics').warning(f"Could not write {kind} cache entry for {key}: {str(e)}")
+    
+    @staticmethod
+    def _atomic_write(path: str, payload: bytes) -> None:
+        """Write a file via a temporary sibling so concurrent readers never see partial data"""
+        fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(path))
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(payload)
+            os.replace(temp_path, path)
+        except OSError:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+
+
+def cached(kind: str, ttl: int) -> Callable:
+    """
+    Cache a USMarketMetrics method's result in its FileCache
+    
+    The cache key is built from the method's positional arguments. None results
+    are never cached so failed fetches are retried on the next call.
+    
+    Args:
+        kind: Cache namespace for the method's results
+        ttl: Lifetime of each entry in seconds
+    """
+    def decorator(func: Callable) -> Callable:
+        @functools.wraps(func)
+        def wrapper(self, *args):
+            key = "|".join(str(arg) for arg in args)
+            value = self._file_cache.get(kind, key)
+            if value is not None:
+                self.logger.info(f"Using cached {kind} data for {key}")
+                return value
+            
+            value = func(self, *args)
+            if value is not None:
+                self._file_cache.set(kind, key, value, ttl)
+            return value
+        return wrapper
+    return decorator
+
 
 class USMarketMetrics:
-    def __init__(self, fred_api_key: str, csv_export_path: Optional[str] = None):
+    def __init__(self, fred_api_key: str, csv_export_path: Optional[str] = None, check_deps: bool = False):
         """
         Initialize with FRED API key
         Get it from: https://fred.stlouisfed.org/docs/api/api_key.html
@@ -28,10 +245,31 @@ class USMarketMetrics:
         Args:
             fred_api_key: API key for FRED
             csv_export_path: Optional path to export data as CSV
+            check_deps: Verify optional dependencies are installed before use
         """
+        import fredapi
         self.fred = fredapi.Fred(api_key=fred_api_key)
         self.csv_export_path = csv_export_path
         self.csv_headers_written = False
+        self._csv_lock = threading.Lock()
+        self._csv_fh = None
+        self._csv_writer = None
+        self._fred_cache: Dict[Tuple[str, Optional[int]], Tuple[float, pd.Series]] = {}
+        self._fred_ttl = FRED_MEMORY_TTL
+        self._metric_cache: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+        self._metric_ttl = METRIC_MEMORY_TTL
+        self._file_cache = FileCache()
+        self._shiller_df: Optional[Tuple[float, pd.DataFrame]] = None
+        
+        # matplotlib is imported on the first plot (see _plot_helper)
+        self._plt = self._mdates = None
+        
+        # Shared HTTP session so spreadsheet downloads reuse pooled keep-alive connections
+        self._http = requests.Session()
+        adapter = HTTPAdapter(pool_connections=8, pool_maxsize=16,
+                              max_retries=Retry(total=3, backoff_factor=0.3))
+        self._http.mount('https://', adapter)
+        self._http.mount('http://', adapter)
         
         # Setup logging
         logging.basicConfig(
@@ -45,36 +283,34 @@ class USMarketMetrics:
         self.logger = logging.getLogger('USMarketMetrics')
         
         # Check for required dependencies
-        self._check_dependencies()
+        if check_deps:
+            self._check_dependencies()
         
         # Initialize CSV file if export path is provided
         if self.csv_export_path:
             self._initialize_csv_export()
         
     def _check_dependencies(self):
-        """Check if all required dependencies are installed"""
+        """
+        Check if all required dependencies are installed
+        
+        Uses importlib.util.find_spec, so nothing is actually imported.
+        
+        Raises:
+            ImportError: If a dependency is missing, with install instructions
+        """
         dependencies = [
-            ('xlrd', 'xlrd>=2.0.1', 'Excel files'),
-            ('openpyxl', 'openpyxl>=3.0.0', 'modern Excel files')
+            ('python_calamine', 'python-calamine>=0.2.3', 'Excel files')
         ]
         
         for module_name, install_spec, description in dependencies:
-            try:
-                importlib.import_module(module_name)
-                self.logger.info(f"{module_name} dependency is installed")
-            except ImportError:
-                self.logger.warning(f"Missing {module_name} dependency. Attempting to install...")
-                print(f"\n[bold yellow]Missing {module_name} dependency required for {description}.[/bold yellow]")
-                
-                try:
-                    # Try to install dependency
-                    subprocess.check_call([sys.executable, "-m", "pip", "install", install_spec])
-                    self.logger.info(f"Successfully installed {module_name}")
-                    print(f"[bold green]Successfully installed {module_name} dependency.[/bold green]")
-                except Exception as e:
-                    self.logger.error(f"Failed to install {module_name}: {str(e)}")
-                    print(f"[bold red]Failed to automatically install {module_name}.[/bold red]")
-                    print(f"Please install it manually with: pip install {install_spec}")
+            if importlib.util.find_spec(module_name) is None:
+                self.logger.error(f"Missing {module_name} dependency required for {description}")
+                raise ImportError(
+                    f"Missing {module_name} dependency required for {description}. "
+                    f"Install it with: pip install {install_spec} (or pip install -r requirements.txt)"
+                )
+            self.logger.info(f"{module_name} dependency is installed")
     
     def _initialize_csv_export(self):
         """Initialize the CSV export file with headers"""
@@ -82,16 +318,18 @@ class USMarketMetrics:
             # Create directory if it doesn't exist
             os.makedirs(os.path.dirname(os.path.abspath(self.csv_export_path)), exist_ok=True)
             
-            # Check if file exists and is empty
-            file_exists = os.path.isfile(self.csv_export_path)
-            file_empty = not file_exists or os.path.getsize(self.csv_export_path) == 0
+            # Keep one buffered handle open for all exports; rows are flushed on close()
+            self._csv_fh = open(self.csv_export_path, mode='a', buffering=1 << 16, newline='')
+            self._csv_writer = csv.writer(self._csv_fh)
             
-            if file_empty:
+            # Append mode starts at the end of the file, so the position tells us if it has content
+            self.csv_headers_written = self._csv_fh.tell() > 0
+            
+            if self.csv_headers_written:
+                self.logger.info(f"CSV export file already exists at {self.csv_export_path}")
+            else:
                 self.logger.info(f"Initializing CSV export file at {self.csv_export_path}")
                 # We'll write headers when the first data is exported
-            else:
-                self.logger.info(f"CSV export file already exists at {self.csv_export_path}")
-                self.csv_headers_written = True
                 
         except Exception as e:
             self.logger.error(f"Error initializing CSV export: {str(e)}", exc_info=True)
@@ -100,81 +338,121 @@ class USMarketMetrics:
     
     def _export_to_csv(self, metric_name: str, data: Dict[str, Any]):
         """Export metric data to CSV file"""
+        self.export_results_to_csv([(metric_name, data)])
+    
+    def export_results_to_csv(self, results: List[Tuple[str, Dict[str, Any]]], bulk: bool = False) -> None:
+        """
+        Export several metric results to the CSV file in a single write
+        
+        Args:
+            results: (metric name, result dict) pairs as returned by get_metric_by_name
+            bulk: Encode all rows up front and write them straight to the file descriptor
+        """
         if not self.csv_export_path:
             return
             
         try:
-            # Make a deep copy to avoid modifying the original data
-            data_copy = data.copy()
-            
-            # Extract metadata
-            timestamp = data_copy.pop('timestamp') if 'timestamp' in data_copy else datetime.now().strftime('%Y-%m-%d')
-            source = data_copy.pop('source') if 'source' in data_copy else 'Unknown'
-            
-            # Prepare rows for CSV
-            rows_to_write = []
-            
-            # Handle different data structures
-            if len(data_copy) == 1 and 'value' in data_copy:
-                # Single value metric (like P/E ratio)
-                row = {
-                    'metric': metric_name,
-                    'sub_metric': 'value',
-                    'value': data_copy['value'],
-                    'timestamp': timestamp,
-                    'source': source,
-                    'retrieval_time': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-                }
-                rows_to_write.append(row)
+            # The retrieval time is the same for every row of this export
+            now = datetime.now()
+            rows_to_write = list(itertools.chain.from_iterable(
+                self._metric_rows(metric_name, data, now) for metric_name, data in results
+            ))
+            if bulk:
+                self._export_rows_bulk(rows_to_write)
             else:
-                # Multiple value metrics (like GDP or Government Debt)
-                for key, value in data_copy.items():
-                    if isinstance(value, dict):
-                        # Handle nested dictionaries (like credit_spreads)
-                        for sub_key, sub_value in value.items():
-                            row = {
-                                'metric': metric_name,
-                                'sub_metric': f"{key}_{sub_key}",
-                                'value': sub_value,
-                                'timestamp': timestamp,
-                                'source': source,
-                                'retrieval_time': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-                            }
-                            rows_to_write.append(row)
-                    else:
-                        # Handle flat key-value pairs
-                        row = {
-                            'metric': metric_name,
-                            'sub_metric': key,
-                            'value': value,
-                            'timestamp': timestamp,
-                            'source': source,
-                            'retrieval_time': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-                        }
-                        rows_to_write.append(row)
-            
-            # Write to CSV
-            file_exists = os.path.isfile(self.csv_export_path) and os.path.getsize(self.csv_export_path) > 0
-            
-            with open(self.csv_export_path, mode='a', newline='') as file:
-                fieldnames = ['metric', 'sub_metric', 'value', 'timestamp', 'source', 'retrieval_time']
-                writer = csv.DictWriter(file, fieldnames=fieldnames)
-                
-                # Write headers if this is the first write
-                if not file_exists or not self.csv_headers_written:
-                    writer.writeheader()
-                    self.csv_headers_written = True
-                
-                # Write all rows
-                for row in rows_to_write:
-                    writer.writerow(row)
-                
-            self.logger.info(f"Exported {metric_name} data to CSV with {len(rows_to_write)} rows")
+                self._export_rows(rows_to_write)
+            
+            self.logger.info(f"Exported {', '.join(name for name, _ in results)} data to CSV with {len(rows_to_write)} rows")
             
         except Exception as e:
             self.logger.error(f"Error exporting to CSV: {str(e)}", exc_info=True)
             print(f"[bold red]Error exporting to CSV: {str(e)}[/bold red]")
     
+    def _metric_rows(self, metric_name: str, data: Dict[str, Any], now: datetime) -> List[tuple]:
+        """Flatten one metric result into CSV rows, in CSV_FIELDNAMES order"""
+        # Extract metadata
+        retrieval_time = now.strftime('%Y-%m-%d %H:%M:%S')
+        timestamp = data.get('timestamp', now.strftime('%Y-%m-%d'))
+        source = data.get('source', 'Unknown')
+        
+        # Flatten nested dictionaries (like credit_spreads) into key_subkey entries
+        metric_items = ((key, value) for key, value in data.items() if key not in ('timestamp', 'source'))
+        flat_items = itertools.chain.from_iterable(
+            ((f"{key}_{sub_key}", sub_value) for sub_key, sub_value in value.items())
+            if isinstance(value, dict) else ((key, value),)
+            for key, value in metric_items
+        )
+        
+        return [(metric_name, sub_metric, value, timestamp, source, retrieval_time)
+                for sub_metric, value in flat_items]
+    
+    def _export_rows(self, rows: List[tuple]) -> None:
+        """Write prepared rows to the CSV file, adding the header on the first write"""
+        # Serialized because metrics may be exported from worker threads
+        with self._csv_lock:
+            if not self.csv_headers_written:
+                self._csv_writer.writerow(CSV_FIELDNAMES)
+                self.csv_headers_written = True
+            
+            self._csv_writer.writerows(rows)
+    
+    def _export_rows_bulk(self, rows: List[tuple]) -> None:
+        """
+        Write prepared rows to the CSV file as one pre-encoded buffer
+        
+        Produces the same output as _export_rows but bypasses the text and csv layers,
+        which matters when many rows are exported at once.
+        """
+        with self._csv_lock:
+            lines = [] if self.csv_headers_written else [_csv_line(CSV_FIELDNAMES)]
+            lines.extend(_csv_line(row) for row in rows)
+            buf = memoryview(''.join(lines).encode(self._csv_fh.encoding))
+            
+            # Anything still buffered in the text handle has to land before our bytes
+            self._csv_fh.flush()
+            fd = self._csv_fh.fileno()
+            while buf:
+                buf = buf[os.write(fd, buf):]
+            self.csv_headers_written = True
+    
+    def close(self) -> None:
+        """Flush and close the CSV export file, if one is open"""
+        with self._csv_lock:
+            if self._csv_fh is not None:
+                self._csv_fh.close()
+                self._csv_fh = None
+                self._csv_writer = None
+    
+    @contextlib.contextmanager
+    def csv_export(self, path: str):
+        """
+        Temporarily export metrics to another CSV file
+        
+        The file is flushed and closed on exit, and any CSV export configured before
+        entering is restored.
+        
+        Args:
+            path: Path of the CSV file to append to
+        """
+        saved = (self.csv_export_path, self.csv_headers_written, self._csv_fh, self._csv_writer)
+        self.csv_export_path, self._csv_fh, self._csv_writer = path, None, None
+        self._initialize_csv_export()
+        try:
+            yield self
+        finally:
+            self.close()
+            self.csv_export_path, self.csv_headers_written, self._csv_fh, self._csv_writer = saved
+    
+    def invalidate(self) -> None:
+        """Forget metric results memoized by get_metric_by_name and the parsed Shiller rows"""
+        self._metric_cache.clear()
+        self._shiller_df = None
+    
+    def __del__(self):
+        # Make sure buffered CSV rows reach disk even if close() was never called
+        if getattr(self, '_csv_fh', None) is not None:
+            self.close()
+    
     def get_pe_ratio(self) -> float:
         """
         Get current US stock market P/E ratio
@@ -186,11 +464,8 @@ class USMarketMetrics:
     def _get_ticker_info(self, symbol: str, description: str, info_field: str) -> float:
         """Get ticker information from Yahoo Finance"""
         try:
-            # Create ticker object
-            ticker = yf.Ticker(symbol)
-            
             # Get requested info
-            value = ticker.info.get(info_field)
+            value = self._get_yahoo_value(symbol, info_field)
             print(f"\nFetching US stock market {description} ({symbol})")
             
             if value:
@@ -202,6 +477,32 @@ class USMarketMetrics:
         except Exception as e:
             return self._log_error(f"fetching {description}", e)
     
+    @cached(kind="yahoo", ttl=YAHOO_CACHE_TTL)
+    def _get_yahoo_value(self, symbol: str, field: str) -> Optional[float]:
+        """
+        Read a single quote field for a symbol from Yahoo Finance
+        
+        Args:
+            symbol: Yahoo Finance ticker symbol
+            field: 'lastPrice' or 'trailingPE'
+            
+        Returns:
+            The field value, or None if Yahoo has no data for it
+        """
+        # yfinance caches quote data on each Ticker, so build a new one for every fetch
+        ticker = _yf().Ticker(symbol)
+        
+        if field == 'lastPrice':
+            # fast_info reads the price from the chart endpoint instead of the full quote summary
+            value = ticker.fast_info.last_price
+        elif field == 'trailingPE':
+            # Valuation ratios are only published in the quote summary
+            value = ticker.get_info().get('trailingPE')
+        else:
+            raise ValueError(f"Unsupported Yahoo Finance field: {field}")
+        
+        return float(value) if value else None
+    
     def get_cape_ratio(self) -> float:
         """
         Get current Cyclically Adjusted P/E (CAPE) ratio for the US market
@@ -209,49 +510,54 @@ class USMarketMetrics:
         Uses Robert Shiller's data from his website
         """
         try:
-            # URL for Shiller's data
-            url = "http://www.econ.yale.edu/~shiller/data/ie_data.xls"
-            self.logger.info(f"Fetching CAPE ratio from Shiller's dataset: {url}")
+            self.logger.info(f"Fetching CAPE ratio from Shiller's dataset: {SHILLER_URL}")
             print(f"\nFetching CAPE ratio from Shiller's dataset")
             
-            if not self._download_file(url, "shiller_temp.xls"):
+            df = self._get_shiller_data()
+            if df is None:
                 return None
             
-            # Read the Excel file
-            df = pd.read_excel("shiller_temp.xls", sheet_name="Data", skiprows=7)
-            
             # Get the most recent CAPE value (column 'CAPE')
             # Column names may vary, so find the CAPE column
-            cape_column = None
-            for col in df.columns:
-                if 'CAPE' in str(col).upper():
-                    cape_column = col
-                    break
-                
-            if not cape_column:
-                self.logger.error("Could not find CAPE column in Shiller's data")
-                raise Exception("Could not find CAPE column in the data")
+            cape_column = self._find_column(df, 'CAPE', "Shiller's data")
             
-            # Get the most recent non-NaN value
-            cape_value = df[cape_column].dropna().iloc[-1]
+            # Get the most recent non-NaN value without materializing the filtered column
+            last_valid_index = df[cape_column].last_valid_index()
+            if last_valid_index is None:
+                raise Exception("No CAPE values found in the data")
+            cape_value = df[cape_column].iat[df.index.get_loc(last_valid_index)]
             
             # Log the result
             self.logger.info(f"Found CAPE ratio: {cape_value}")
             print(f"Found CAPE ratio: {cape_value}")
             
-            # Clean up temp file
-            if os.path.exists("shiller_temp.xls"):
-                os.remove("shiller_temp.xls")
-            
             return float(cape_value)
             
         except Exception as e:
-            # Clean up temp file if it exists
-            if os.path.exists("shiller_temp.xls"):
-                os.remove("shiller_temp.xls")
-            
             return self._log_error("fetching CAPE ratio", e)
     
+    def _get_shiller_data(self) -> Optional[pd.DataFrame]:
+        """
+        Get the most recent rows of Shiller's dataset
+        
+        The download is cached on disk and the parsed rows are kept on the instance for
+        SHILLER_MEMORY_TTL seconds, so the CAPE value and its timestamp share a single
+        download and parse.
+        
+        Returns:
+            DataFrame of the trailing rows of the 'Data' sheet, or None if the download failed
+        """
+        entry = self._shiller_df
+        if entry is not None and time.monotonic() - entry[0] < SHILLER_MEMORY_TTL:
+            return entry[1]
+        
+        content = self._download_file(SHILLER_URL)
+        if content is None:
+            return None
+        df = self._read_excel_tail(content, sheet_name="Data", header_row=7)
+        self._shiller_df = (time.monotonic(), df)
+        return df
+    
     def _get_cape_from_fred(self) -> float:
         """Fallback method to get CAPE ratio from FRED"""
         try:
@@ -278,19 +584,13 @@ class USMarketMetrics:
         try:
             print(f"\nFetching credit spreads")
             
-            # Get BAA corporate bond yield
-            baa_yield = self._safe_get_fred_series('BAA')
-            
-            # Get 10-year Treasury yield
-            treasury_10y = self._safe_get_fred_series('DGS10')
+            # Get BAA corporate bond yield and 10-year Treasury yield
+            latest_baa = self._latest('BAA')
+            latest_10y = self._latest('DGS10')
             
-            if baa_yield is None or treasury_10y is None or baa_yield.empty or treasury_10y.empty:
+            if latest_baa is None or latest_10y is None:
                 return {'baa_yield': None, 'treasury_10y': None, 'baa_spread': None}
             
-            # Get the most recent values
-            latest_baa = baa_yield.iloc[-1]
-            latest_10y = treasury_10y.iloc[-1]
-            
             # Calculate the spread
             spread = latest_baa - latest_10y
             
@@ -300,9 +600,9 @@ class USMarketMetrics:
             print(f"Credit Spread: {spread:.2f}% ({int(spread*100)} basis points)")
             
             return {
-                'baa_yield': float(latest_baa),
-                'treasury_10y': float(latest_10y),
-                'baa_spread': float(spread)
+                'baa_yield': latest_baa,
+                'treasury_10y': latest_10y,
+                'baa_spread': spread
             }
         except Exception as e:
             return self._log_error("calculating credit spreads", e)
@@ -313,18 +613,15 @@ class USMarketMetrics:
             print(f"\nFetching US stock market to GDP ratio")
             
             # Get market cap to GDP from FRED (DDDM01USA156NWDB)
-            market_to_gdp = self._safe_get_fred_series('DDDM01USA156NWDB')
+            latest_value = self._latest('DDDM01USA156NWDB')
             
-            if market_to_gdp is None or market_to_gdp.empty:
+            if latest_value is None:
                 return None
             
-            # Get the most recent value
-            latest_value = market_to_gdp.iloc[-1]
-            
             self.logger.info(f"Found market cap to GDP ratio: {latest_value:.2f}%")
             print(f"Found market cap to GDP ratio: {latest_value:.2f}%")
             
-            return float(latest_value)
+            return latest_value
         except Exception as e:
             return self._log_error("fetching market to GDP ratio", e)
     
@@ -333,23 +630,19 @@ class USMarketMetrics:
         try:
             print(f"\nFetching US GDP metrics")
             
-            gdp = self._safe_get_fred_series('GDP')  # Nominal GDP
-            gdp_growth = self._safe_get_fred_series('A191RL1Q225SBEA')  # Real GDP Growth Rate
+            latest_gdp = self._latest('GDP')  # Nominal GDP
+            latest_gdp_growth = self._latest('A191RL1Q225SBEA')  # Real GDP Growth Rate
             
-            if gdp is None or gdp_growth is None or gdp.empty or gdp_growth.empty:
+            if latest_gdp is None or latest_gdp_growth is None:
                 return {'gdp': None, 'gdp_growth': None}
             
-            # Get the most recent values
-            latest_gdp = gdp.iloc[-1]
-            latest_gdp_growth = gdp_growth.iloc[-1]
-            
             self.logger.info(f"Found GDP: ${latest_gdp/1000:.2f} trillion, Growth Rate: {latest_gdp_growth:.2f}%")
             print(f"Found GDP: ${latest_gdp/1000:.2f} trillion")
             print(f"GDP Growth Rate: {latest_gdp_growth:.2f}%")
             
             return {
-                'gdp': float(latest_gdp),
-                'gdp_growth': float(latest_gdp_growth)
+                'gdp': latest_gdp,
+                'gdp_growth': latest_gdp_growth
             }
         except Exception as e:
             return self._log_error("fetching GDP metrics", e)
@@ -359,23 +652,18 @@ class USMarketMetrics:
         try:
             print(f"\nFetching US government debt and deficit metrics")
             
-            govt_debt = self._safe_get_fred_series('GFDEBTN')  # Federal Debt: Total Public Debt
-            govt_deficit = self._safe_get_fred_series('FYFSD')  # Federal Surplus or Deficit
+            latest_debt = self._latest('GFDEBTN')  # Federal Debt: Total Public Debt
+            latest_deficit = self._latest('FYFSD')  # Federal Surplus or Deficit
             
-            if govt_debt is None or govt_deficit is None or govt_debt.empty or govt_deficit.empty:
+            if latest_debt is None or latest_deficit is None:
                 return {'govt_debt': None, 'govt_deficit': None, 'debt_to_gdp': None}
             
-            # Get the most recent values
-            latest_debt = govt_debt.iloc[-1]
-            latest_deficit = govt_deficit.iloc[-1]
-            
             # Get GDP for debt-to-GDP calculation
-            gdp = self._safe_get_fred_series('GDP')
+            latest_gdp = self._latest('GDP')
             
-            if gdp is None or gdp.empty:
+            if latest_gdp is None:
                 debt_to_gdp = None
             else:
-                latest_gdp = gdp.iloc[-1]
                 debt_to_gdp = (latest_debt / latest_gdp) * 100  # Convert to percentage
             
             self.logger.info(f"Found Government Debt: ${latest_debt/1000000:.2f} trillion")
@@ -389,9 +677,9 @@ class USMarketMetrics:
                 print(f"Debt-to-GDP: {debt_to_gdp:.2f}%")
             
             return {
-                'govt_debt': float(latest_debt),
-                'govt_deficit': float(latest_deficit),
-                'debt_to_gdp': float(debt_to_gdp) if debt_to_gdp is not None else None
+                'govt_debt': latest_debt,
+                'govt_deficit': latest_deficit,
+                'debt_to_gdp': debt_to_gdp
             }
         except Exception as e:
             return self._log_error("fetching government metrics", e)
@@ -401,18 +689,15 @@ class USMarketMetrics:
         try:
             print(f"\nFetching US 10-year Treasury yield")
             
-            treasury_10y = self._safe_get_fred_series('DGS10')
+            latest_yield = self._latest('DGS10')
             
-            if treasury_10y is None or treasury_10y.empty:
+            if latest_yield is None:
                 return None
             
-            # Get the most recent value
-            latest_yield = treasury_10y.iloc[-1]
-            
             self.logger.info(f"Found 10-year Treasury yield: {latest_yield:.2f}%")
             print(f"Found 10-year Treasury yield: {latest_yield:.2f}%")
             
-            return float(latest_yield)
+            return latest_yield
         except Exception as e:
             return self._log_error("fetching 10-year Treasury yield", e)
     
@@ -426,11 +711,9 @@ class USMarketMetrics:
             if cpi is None or cpi.empty or len(cpi) < 13:  # Need at least 13 months
                 return None
             
-            # Calculate year-over-year change
-            latest_cpi = cpi.iloc[-1]
-            year_ago_cpi = cpi.iloc[-13]  # 12 months ago
-            
-            inflation_rate = ((latest_cpi / year_ago_cpi) - 1) * 100
+            # Calculate year-over-year change for the whole series (monthly data, so 12 periods)
+            yoy = cpi.pct_change(12, fill_method=None)
+            inflation_rate = yoy.iloc[-1] * 100
             
             self.logger.info(f"Calculated inflation rate: {inflation_rate:.2f}%")
             print(f"Found inflation rate: {inflation_rate:.2f}%")
@@ -450,11 +733,8 @@ class USMarketMetrics:
     def get_asset_price(self, ticker_symbol: str, asset_name: str, unit: str = "") -> float:
         """Helper method to get asset prices from Yahoo Finance"""
         try:
-            # Create ticker object
-            ticker = yf.Ticker(ticker_symbol)
-            
             # Get current price
-            price = ticker.info.get('regularMarketPrice')
+            price = self._get_yahoo_value(ticker_symbol, 'lastPrice')
             print(f"\nFetching {asset_name} price ({ticker_symbol})")
             
             if price:
@@ -482,43 +762,28 @@ class USMarketMetrics:
     def get_equity_risk_premium(self) -> Dict[str, float]:
         """Get equity risk premium (ERP) from Damodaran's data"""
         try:
-            # Check if openpyxl is installed
-            try:
-                importlib.import_module('openpyxl')
-            except ImportError:
-                self.logger.error("openpyxl dependency is required but not installed")
-                print("[bold red]Error: openpyxl dependency is required but not installed.[/bold red]")
-                print("Please install it with: pip install openpyxl>=3.0.0")
-                # Fall back to calculation immediately if openpyxl is not available
-                return self._calculate_equity_risk_premium()
-            
-            # URL for Damodaran's implied ERP spreadsheet
-            url = "https://pages.stern.nyu.edu/~adamodar/pc/implprem/ERPbymonth.xlsx"
-            self.logger.info(f"Fetching equity risk premium from Damodaran's dataset: {url}")
+            # Damodaran's implied ERP spreadsheet
+            self.logger.info(f"Fetching equity risk premium from Damodaran's dataset: {DAMODARAN_URL}")
             print(f"\nFetching equity risk premium from Damodaran's dataset")
             
-            if not self._download_file(url, "damodaran_temp.xlsx"):
+            content = self._download_file(DAMODARAN_URL)
+            if content is None:
                 return self._calculate_equity_risk_premium()
             
             # Read the Excel file
-            df = pd.read_excel("damodaran_temp.xlsx")
+            df = self._read_excel_tail(content)
             
             # The ERP is in the column 'ERP' or similar
             # Find the column with ERP data (column names may vary)
-            erp_column = None
-            for col in df.columns:
-                if 'ERP' in str(col).upper():
-                    erp_column = col
-                    break
-                
-            if not erp_column:
-                self.logger.error("Could not find ERP column in Damodaran's data")
-                raise Exception("Could not find ERP column in the data")
+            erp_column = self._find_column(df, 'ERP', "Damodaran's data")
             
             # Get the most recent non-NaN value
             last_valid_index = df[erp_column].last_valid_index()
-            erp_value = df.loc[last_valid_index, erp_column]
-            last_date = df.iloc[last_valid_index, 0]  # Assuming first column is date
+            if last_valid_index is None:
+                raise Exception("No ERP values found in the data")
+            position = df.index.get_loc(last_valid_index)
+            erp_value = df[erp_column].iat[position]
+            last_date = df.iat[position, 0]  # Assuming first column is date
             
             # Convert to float if it's not already
             try:
@@ -538,20 +803,12 @@ class USMarketMetrics:
             self.logger.info(f"Found equity risk premium: {erp_value}% (as of {last_date})")
             print(f"Found equity risk premium: {erp_value}%")
             
-            # Clean up temp file
-            if os.path.exists("damodaran_temp.xlsx"):
-                os.remove("damodaran_temp.xlsx")
-            
             return {
                 'value': erp_value,
                 'date': str(last_date)
             }
             
         except Exception as e:
-            # Clean up temp file if it exists
-            if os.path.exists("damodaran_temp.xlsx"):
-                os.remove("damodaran_temp.xlsx")
-            
             return self._log_error("fetching Damodaran's equity risk premium", e)
     
     def _calculate_equity_risk_premium(self) -> Dict[str, float]:
@@ -605,10 +862,10 @@ class USMarketMetrics:
             print(f"\nFetching S&P 500 earnings growth data")
             
             # Get quarterly earnings data - using Corporate Profits as a proxy
-            corporate_profits = self.fred.get_series('CP')
+            corporate_profits = self._safe_get_fred_series('CP')
             
             # Need at least 5 quarters of data to calculate YoY growth
-            if len(corporate_profits) < 5:
+            if corporate_profits is None or len(corporate_profits) < 5:
                 self.logger.warning("Not enough earnings data to calculate growth")
                 return {'growth_rate': None}
             
@@ -631,7 +888,7 @@ class USMarketMetrics:
             print(f"Found corporate profits growth: {growth_rate:.2f}%")
             
             return {
-                'growth_rate': growth_rate,
+                'growth_rate': float(growth_rate),
                 'recent_value': float(recent_value),
                 'year_ago_value': float(year_ago_value),
                 'recent_date': str(recent_date.strftime('%Y-%m-%d')),
@@ -640,63 +897,60 @@ class USMarketMetrics:
         except Exception as e:
             return self._log_error("calculating earnings growth", e)
     
+    def prefetch(self) -> None:
+        """Warm the FRED caches before fetching many metrics concurrently"""
+        # Fetch every FRED series once up front so metrics sharing a series don't race to fetch it
+        self._prefetch_fred(FRED_SERIES_IDS)
+    
     def get_all_metrics(self) -> Dict[str, Any]:
-        """Get all available metrics"""
+        """Get all available metrics, fetching them concurrently"""
         # Use the metric definitions to get all metrics
-        metrics = {}
+        definitions = {name: func for name, (func, _) in self.get_metric_definitions().items()
+                       if name != 'US All Metrics'}  # Avoid recursion
+        results = {}
         
-        for metric_name, (func, _) in self.get_metric_definitions().items():
-            if metric_name != 'US All Metrics':  # Avoid recursion
+        self.prefetch()
+        
+        # Each metric is an independent network round-trip, so overlap them
+        with ThreadPoolExecutor(max_workers=12) as executor:
+            futures = {executor.submit(func): metric_name for metric_name, func in definitions.items()}
+            for future in as_completed(futures):
+                metric_name = futures[future]
                 try:
-                    result = func()
-                    
-                    # Handle different result formats
-                    if isinstance(result, dict) and 'value' in result:
-                        metrics[self._normalize_metric_name(metric_name)] = result['value']
-                    elif isinstance(result, dict):
-                        # For metrics that return multiple values (e.g., credit_spreads)
-                        for key, value in result.items():
-                            metrics[key] = value
-                    else:
-                        metrics[self._normalize_metric_name(metric_name)] = result
+                    results[metric_name] = future.result()
                 except Exception as e:
                     self.logger.error(f"Error getting {metric_name}: {str(e)}")
-                    metrics[self._normalize_metric_name(metric_name)] = None
+                    results[metric_name] = None
+        
+        # Assemble in definition order so the output is stable across runs
+        metrics = {}
+        for metric_name in definitions:
+            result = results[metric_name]
+            
+            # Handle different result formats
+            if isinstance(result, dict) and 'value' in result:
+                metrics[self._normalize_metric_name(metric_name)] = result['value']
+            elif isinstance(result, dict):
+                # For metrics that return multiple values (e.g., credit_spreads)
+                for key, value in result.items():
+                    metrics[key] = value
+            else:
+                metrics[self._normalize_metric_name(metric_name)] = result
         
         return metrics
     
-    def _normalize_metric_name(self, metric_name: str) -> str:
+    @staticmethod
+    def _normalize_metric_name(metric_name: str) -> str:
         """Convert display metric name to normalized variable name"""
-        if metric_name == 'US P/E Ratio':
-            return 'pe_ratio'
-        elif metric_name == 'US CAPE Ratio':
-            return 'cape_ratio'
-        elif metric_name == 'US Credit Spreads':
-            return 'credit_spreads'
-        elif metric_name == 'US Stock Market / GDP':
-            return 'market_to_gdp'
-        elif metric_name == 'US GDP':
-            return 'gdp'
-        elif metric_name == 'US Government Debt & Deficit':
-            return 'government'
-        elif metric_name == 'US 10-Year Yield':
-            return '10yr_yield'
-        elif metric_name == 'US Inflation Rate':
-            return 'inflation_rate'
-        elif metric_name == 'US Equity Risk Premium':
-            return 'equity_risk_premium'
-        elif metric_name == 'US Earnings Growth':
-            return 'earnings_growth'
-        elif metric_name == 'Gold Price':
-            return 'gold_price'
-        elif metric_name == 'Bitcoin Price':
-            return 'bitcoin_price'
-        elif metric_name == 'WTI Crude Oil Price':
-            return 'wti_crude_price'
-        return metric_name.lower().replace(' ', '_')
+        return METRIC_SHORT_NAMES.get(metric_name, metric_name.lower().replace(' ', '_'))
 
     def get_metric_definitions(self) -> Dict[str, tuple]:
         """Return a mapping of metric names to their functions and sources"""
+        return self._metric_defs
+
+    @functools.cached_property
+    def _metric_defs(self) -> Dict[str, tuple]:
+        """Dispatch table of metric names to bound methods and sources, built once per instance"""
         return {
             'US P/E Ratio': (self.get_pe_ratio, 'Yahoo Finance - VTI (Total US Market)'),
             'US CAPE Ratio': (self.get_cape_ratio, 'Robert Shiller\'s Dataset'),
@@ -714,8 +968,24 @@ class USMarketMetrics:
             'US All Metrics': (self.get_all_metrics, 'Multiple Sources')
         }
 
-    def get_metric_by_name(self, metric_name: str) -> Dict[str, Any]:
-        """Get a specific metric by name with timestamp and source"""
+    def get_metric_by_name(self, metric_name: str, export: bool = True) -> Dict[str, Any]:
+        """
+        Get a specific metric by name with timestamp and source
+        
+        Results are reused for METRIC_MEMORY_TTL seconds unless CSV export is enabled,
+        in which case every call fetches fresh data.
+        
+        Args:
+            metric_name: Display name of the metric (a key of get_metric_definitions)
+            export: Write the result to the CSV file when CSV export is enabled
+        """
+        use_memo = not self.csv_export_path
+        if use_memo:
+            entry = self._metric_cache.get(metric_name)
+            if entry is not None and time.monotonic() - entry[0] < self._metric_ttl:
+                # Hand out a copy so callers can't modify the memoized result
+                return copy.deepcopy(entry[1])
+        
         metric_map = self.get_metric_definitions()
         
         func, source = metric_map[metric_name]
@@ -734,8 +1004,11 @@ class USMarketMetrics:
             result['source'] = source
         
         # Export to CSV if enabled
-        if self.csv_export_path:
-            self._export_to_csv(metric_name, result.copy())
+        if export and self.csv_export_path:
+            self._export_to_csv(metric_name, result)
+        
+        if use_memo:
+            self._metric_cache[metric_name] = (time.monotonic(), copy.deepcopy(result))
         
         return result
 
@@ -743,24 +1016,20 @@ class USMarketMetrics:
         """Get the appropriate timestamp for each metric type"""
         try:
             if metric_name == 'US GDP':
-                gdp = self.fred.get_series('GDP')
-                return gdp.index[-1].strftime('%Y-%m-%d')
+                return self._fred_observation_end('GDP')
             elif metric_name == 'US Government Debt & Deficit':
-                debt = self.fred.get_series('GFDEBTN')
-                return debt.index[-1].strftime('%Y-%m-%d')
+                return self._fred_observation_end('GFDEBTN')
             elif metric_name == 'US Inflation Rate':
-                cpi = self.fred.get_series('CPIAUCSL')
-                return cpi.index[-1].strftime('%Y-%m-%d')
+                return self._fred_observation_end('CPIAUCSL')
             elif metric_name == 'US Credit Spreads':
-                baa = self.fred.get_series('BAA')
-                return baa.index[-1].strftime('%Y-%m-%d')
+                return self._fred_observation_end('BAA')
             elif metric_name == 'US CAPE Ratio':
                 try:
-                    # Get date from Shiller's data
-                    url = "http://www.econ.yale.edu/~shiller/data/ie_data.xls"
-                    df = pd.read_excel(url, sheet_name='Data', header=7)
+                    # Get date from Shiller's data, reusing the rows parsed for the CAPE value
+                    df = self._get_shiller_data()
                     # Date is in the 'Date' column, get the last non-NaN CAPE row
-                    last_date = df.loc[df['CAPE'].last_valid_index(), 'Date']
+                    cape_column = self._find_column(df, 'CAPE', "Shiller's data")
+                    last_date = df.loc[df[cape_column].last_valid_index(), 'Date']
                     # Convert to datetime if it's not already
                     if not isinstance(last_date, datetime):
                         # Shiller's dates are often in decimal year format (e.g., 2023.1)
@@ -770,33 +1039,66 @@ class USMarketMetrics:
                     return last_date.strftime('%Y-%m-%d')
                 except Exception:
                     # Fallback to FRED if Shiller's data fails
-                    cape = self.fred.get_series('CSUSHPINSA')
-                    return cape.index[-1].strftime('%Y-%m-%d')
+                    return self._fred_observation_end('CSUSHPINSA')
             else:
                 return datetime.now().strftime('%Y-%m-%d')
         except Exception:
             return 'Date not available'
 
-    def get_historical_data(self, series_id: str, start_date: Optional[str] = None, end_date: Optional[str] = None) -> pd.DataFrame:
+    def _fred_observation_end(self, series_id: str) -> str:
         """
-        Get historical data for a FRED series
+        Get the date of the latest observation of a FRED series
+        
+        Uses the series if this instance already holds it in memory, otherwise FRED's
+        series metadata, so the full series is only downloaded as a last resort.
         
         Args:
             series_id: FRED series ID
-            start_date: Start date in 'YYYY-MM-DD' format (optional)
-            end_date: End date in 'YYYY-MM-DD' format (optional)
             
         Returns:
-            DataFrame with historical data
+            The date as YYYY-MM-DD
         """
+        entry = self._fred_cache.get((series_id, FRED_LOOKBACK_DAYS.get(series_id)))
+        if entry is not None and time.monotonic() - entry[0] < self._fred_ttl:
+            return entry[1].index[-1].strftime('%Y-%m-%d')
+        
+        observation_end = self._fetch_fred_observation_end(series_id)
+        if observation_end is not None:
+            return observation_end
+        
+        series = self._safe_get_fred_series(series_id)
+        return series.index[-1].strftime('%Y-%m-%d')
+
+    @cached(kind="fred_info", ttl=FRED_CACHE_TTL)
+    def _fetch_fred_observation_end(self, series_id: str) -> Optional[str]:
+        """Fetch a FRED series' observation_end from its metadata, without its observations"""
         try:
-            # Convert string dates to datetime if provided
-            start = datetime.strptime(start_date, '%Y-%m-%d') if start_date else None
-            end = datetime.strptime(end_date, '%Y-%m-%d') if end_date else None
+            return str(self.fred.get_series_info(series_id)['observation_end'])
+        except Exception as e:
+            return self._log_error(f"fetching FRED series info {series_id}", e)
+
+    def get_historical_data(self, series_id: str, start_date: Optional[datetime] = None,
+                            end_date: Optional[datetime] = None,
+                            downcast: bool = False) -> Union[pd.DataFrame, pd.Series]:
+        """
+        Get historical data for a FRED series
+        
+        Args:
+            series_id: FRED series ID
+            start_date: First observation date (optional)
+            end_date: Last observation date (optional)
+            downcast: Return a float32 Series named 'value' instead of a DataFrame (for plotting)
             
+        Returns:
+            DataFrame with historical data, or a float32 Series if downcast is set
+        """
+        try:
             # Get data from FRED
             self.logger.info(f"Fetching historical data for series {series_id}")
-            data = self.fred.get_series(series_id, observation_start=start, observation_end=end)
+            data = self.fred.get_series(series_id, observation_start=start_date, observation_end=end_date)
+            
+            if downcast:
+                return data.astype(np.float32, copy=False).rename('value')
             
             # Convert to DataFrame
             df = pd.DataFrame(data, columns=['value'])
@@ -806,13 +1108,17 @@ class USMarketMetrics:
         except Exception as e:
             self.logger.error(f"Error fetching historical data for {series_id}: {str(e)}", exc_info=True)
             print(f"[bold red]Error fetching historical data: {str(e)}[/bold red]")
-            return pd.DataFrame()
+            return pd.Series(dtype=np.float32, name='value') if downcast else pd.DataFrame()
 
     def _plot_helper(self, save_path: Optional[str] = None) -> bool:
-        """Helper function to check for matplotlib and handle plot saving"""
+        """Helper function to import matplotlib once and keep it on the instance"""
+        if self._plt is not None:
+            return True
+        
         try:
             import matplotlib.pyplot as plt
             import matplotlib.dates as mdates
+            self._plt, self._mdates = plt, mdates
             return True
         except ImportError:
             self.logger.error("matplotlib is required for plotting but not installed")
@@ -830,16 +1136,16 @@ class USMarketMetrics:
         # Show the plot
         plt.show()
 
-    def plot_series(self, series_id: str, title: str, start_date: Optional[str] = None, 
-                    end_date: Optional[str] = None, save_path: Optional[str] = None) -> None:
+    def plot_series(self, series_id: str, title: str, start_date: Optional[datetime] = None, 
+                    end_date: Optional[datetime] = None, save_path: Optional[str] = None) -> None:
         """
         Plot a FRED series and optionally save to file
         
         Args:
             series_id: FRED series ID
             title: Title for the plot
-            start_date: Start date in 'YYYY-MM-DD' format (optional)
-            end_date: End date in 'YYYY-MM-DD' format (optional)
+            start_date: First date to plot (optional)
+            end_date: Last date to plot (optional)
             save_path: Path to save the plot (optional)
         """
         try:
@@ -847,13 +1153,12 @@ class USMarketMetrics:
             if not self._plot_helper():
                 return
             
-            import matplotlib.pyplot as plt
-            import matplotlib.dates as mdates
+            plt, mdates = self._plt, self._mdates
             
             # Get the data
-            df = self.get_historical_data(series_id, start_date, end_date)
+            series = self.get_historical_data(series_id, start_date, end_date, downcast=True)
             
-            if df.empty:
+            if series.empty:
                 print(f"[bold yellow]No data available for series {series_id}[/bold yellow]")
                 return
             
@@ -862,16 +1167,18 @@ class USMarketMetrics:
             units = series_info.get('units', '')
             
             # Create the plot
+            # Convert the dates to matplotlib's float day numbers once, up front
             plt.figure(figsize=(12, 6))
-            plt.plot(df.index, df['value'])
+            plt.plot(mdates.date2num(series.index.values), series.values)
             
             # Format the plot
             plt.title(f"{title} ({series_id})")
             plt.xlabel('Date')
             plt.ylabel(f"Value ({units})" if units else "Value")
             
-            # Format x-axis dates
+            # Format x-axis dates; the x values are plain floats, so mark the axis as dates
             ax = plt.gca()
+            ax.xaxis_date()
             ax.xaxis.set_major_formatter(mdates.DateFormatter('%Y-%m-%d'))
             plt.xticks(rotation=45)
             
@@ -888,7 +1195,7 @@ class USMarketMetrics:
             print(f"[bold red]Error plotting series: {str(e)}[/bold red]")
 
     def plot_multiple_series(self, series_ids: List[str], labels: List[str], title: str, 
-                             start_date: Optional[str] = None, end_date: Optional[str] = None,
+                             start_date: Optional[datetime] = None, end_date: Optional[datetime] = None,
                              save_path: Optional[str] = None) -> None:
         """
         Plot multiple FRED series on the same graph
@@ -897,8 +1204,8 @@ class USMarketMetrics:
             series_ids: List of FRED series IDs
             labels: List of labels for each series
             title: Title for the plot
-            start_date: Start date in 'YYYY-MM-DD' format (optional)
-            end_date: End date in 'YYYY-MM-DD' format (optional)
+            start_date: First date to plot (optional)
+            end_date: Last date to plot (optional)
             save_path: Path to save the plot (optional)
         """
         try:
@@ -906,20 +1213,22 @@ class USMarketMetrics:
             if not self._plot_helper():
                 return
             
-            import matplotlib.pyplot as plt
-            import matplotlib.dates as mdates
+            plt, mdates = self._plt, self._mdates
             
             if len(series_ids) != len(labels):
                 raise ValueError("Number of series IDs must match number of labels")
             
+            # Fetch all series concurrently; map() keeps the input order so labels still line up
+            with ThreadPoolExecutor(max_workers=min(8, len(series_ids)) or 1) as executor:
+                fetched = list(executor.map(
+                    lambda s: self.get_historical_data(s, start_date, end_date, downcast=True), series_ids))
+            
             plt.figure(figsize=(12, 6))
             
             # Plot each series
-            for i, (series_id, label) in enumerate(zip(series_ids, labels)):
-                df = self.get_historical_data(series_id, start_date, end_date)
-                
-                if not df.empty:
-                    plt.plot(df.index, df['value'], label=label)
+            for series_id, label, series in zip(series_ids, labels, fetched):
+                if not series.empty:
+                    plt.plot(mdates.date2num(series.index.values), series.values, label=label)
                 else:
                     print(f"[bold yellow]No data available for series {series_id}[/bold yellow]")
             
@@ -929,8 +1238,9 @@ class USMarketMetrics:
             plt.ylabel('Value')
             plt.legend()
             
-            # Format x-axis dates
+            # Format x-axis dates; the x values are plain floats, so mark the axis as dates
             ax = plt.gca()
+            ax.xaxis_date()
             ax.xaxis.set_major_formatter(mdates.DateFormatter('%Y-%m-%d'))
             plt.xticks(rotation=45)
             
@@ -952,40 +1262,153 @@ class USMarketMetrics:
         print(f"Error {message.lower()}: {str(exception)}")
         return None
 
-    def _safe_get_fred_series(self, series_id: str) -> Optional[pd.Series]:
-        """Safely fetch a series from FRED with error handling"""
+    def _safe_get_fred_series(self, series_id: str, lookback_days: Optional[int] = None) -> Optional[pd.Series]:
+        """
+        Safely fetch a series from FRED, reusing series this instance fetched within the last
+        FRED_MEMORY_TTL seconds
+        
+        Args:
+            series_id: FRED series ID
+            lookback_days: Days of history to request (defaults to FRED_LOOKBACK_DAYS,
+                           full history for series not listed there)
+            
+        Returns:
+            The series, or None if it could not be fetched
+        """
+        if lookback_days is None:
+            lookback_days = FRED_LOOKBACK_DAYS.get(series_id)
+        
+        cache_key = (series_id, lookback_days)
+        entry = self._fred_cache.get(cache_key)
+        if entry is not None and time.monotonic() - entry[0] < self._fred_ttl:
+            return entry[1]
+        
+        series = self._fetch_fred_series(series_id, lookback_days)
+        if series is not None:
+            self._fred_cache[cache_key] = (time.monotonic(), series)
+        return series
+
+    def _latest(self, series_id: str) -> Optional[float]:
+        """
+        Get the most recent observation of a FRED series
+        
+        Args:
+            series_id: FRED series ID
+            
+        Returns:
+            The latest non-missing value, or None if the series is unavailable
+        """
+        series = self._safe_get_fred_series(series_id)
+        if series is None:
+            return None
+        
+        # FRED reports holidays and unpublished periods as NaN, so skip trailing gaps
+        last_valid_index = series.last_valid_index()
+        if last_valid_index is None:
+            return None
+        return float(series[last_valid_index])
+
+    @cached(kind="fred", ttl=FRED_CACHE_TTL)
+    def _fetch_fred_series(self, series_id: str, lookback_days: Optional[int]) -> Optional[pd.Series]:
+        """Fetch a series from FRED with error handling"""
         try:
-            return self.fred.get_series(series_id)
+            if lookback_days is None:
+                return self.fred.get_series(series_id)
+            
+            # Only request the recent window so less data is transferred and parsed
+            start = (datetime.today() - timedelta(days=lookback_days)).strftime('%Y-%m-%d')
+            return self.fred.get_series(series_id, observation_start=start)
         except Exception as e:
             return self._log_error(f"fetching FRED series {series_id}", e)
 
-    def _download_file(self, url: str, temp_filename: str) -> bool:
-        """Download file from URL and save temporarily"""
+    def _prefetch_fred(self, series_ids: Tuple[str, ...]) -> None:
+        """
+        Fetch several FRED series in parallel into the instance cache
+        
+        Args:
+            series_ids: FRED series IDs to prefetch
+        """
+        self.logger.info(f"Prefetching FRED series: {', '.join(series_ids)}")
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            list(executor.map(self._safe_get_fred_series, series_ids))
+
+    def _read_excel_tail(self, content: bytes, sheet_name: Optional[str] = None, header_row: int = 0,
+                         tail_rows: int = EXCEL_TAIL_ROWS) -> pd.DataFrame:
+        """
+        Read the header row and the last rows of a spreadsheet
+        
+        Only the latest values are ever used, so calamine's decoded rows are streamed
+        and only the header and the last tail_rows rows are turned into Python objects
+        and run through pandas' type inference.
+        
+        Args:
+            content: Raw bytes of the Excel file
+            sheet_name: Sheet to read (first sheet if not given)
+            header_row: Zero-based index of the row holding the column names
+            tail_rows: Number of trailing rows to load
+            
+        Returns:
+            DataFrame of the trailing rows, with empty cells as NaN
+        """
+        from python_calamine import CalamineWorkbook
+        
+        workbook = CalamineWorkbook.from_filelike(io.BytesIO(content))
+        sheet = workbook.get_sheet_by_name(sheet_name or workbook.sheet_names[0])
+        
+        # Stream the rows instead of materializing the whole sheet; only the header and a
+        # bounded window of trailing rows are ever held as Python objects
+        rows = sheet.iter_rows()
+        header = next(itertools.islice(rows, header_row, None))
+        tail = collections.deque(rows, maxlen=tail_rows)
+        
+        # calamine reports empty cells as '', which pandas would not treat as missing
+        return pd.DataFrame([[None if cell == '' else cell for cell in row] for row in tail],
+                            columns=header)
+    
+    def _find_column(self, df: pd.DataFrame, keyword: str, dataset: str) -> Any:
+        """
+        Find the first column whose name contains a keyword (case-insensitive)
+        
+        Args:
+            df: DataFrame to search
+            keyword: Upper-case text to look for in the column names
+            dataset: Description of the data used in error messages
+            
+        Returns:
+            The matching column label
+        """
+        matches = df.columns[df.columns.astype(str).str.upper().str.contains(keyword, regex=False)]
+        
+        if matches.empty:
+            self.logger.error(f"Could not find {keyword} column in {dataset}")
+            raise Exception(f"Could not find {keyword} column in the data")
+        
+        return matches[0]
+    
+    @cached(kind="download", ttl=DOWNLOAD_CACHE_TTL)
+    def _download_file(self, url: str) -> Optional[bytes]:
+        """Download a file from URL into memory"""
         try:
             self.logger.info(f"Downloading data from: {url}")
             
             start_time = time.time()
-            response = requests.get(url)
-            self.logger.info(f"Response status code: {response.status_code}")
-            
-            if response.status_code != 200:
-                self.logger.error(f"Failed to fetch data. Status code: {response.status_code}")
-                raise Exception(f"Failed to fetch data: HTTP {response.status_code}")
-            
-            # Save the file temporarily
-            with open(temp_filename, "wb") as f:
-                f.write(response.content)
+            with self._http.get(url, stream=True, timeout=30) as response:
+                self.logger.info(f"Response status code: {response.status_code}")
+                response.raise_for_status()
+                
+                # Stream the body in order in 1 MiB chunks; they are joined into one bytes object
+                content = b"".join(response.iter_content(chunk_size=1 << 20))
             
             elapsed_time = time.time() - start_time
             self.logger.info(f"Request completed in {elapsed_time:.2f} seconds")
             
-            return True
+            return content
             
         except Exception as e:
             return self._log_error(f"downloading {url}", e)
 
 def display_ascii_art():
-    console = Console()
+    console = _CONSOLE
     ascii_art = """
 [bold magenta]
     ███╗   ███╗ █████╗ ██████╗ ██╗  ██╗███████╗████████╗███████╗
@@ -1020,46 +1443,69 @@ def get_metric_choices() -> List[str]:
         '17. Plot Multiple Series',
     ]
 
+# Menu number -> menu text, built once for get_user_choice
+_CHOICE_MAP = {int(num): text for num, text in (c.split('. ', 1) for c in get_metric_choices())}
+
+def _format_percent(v: Any) -> str:
+    return f"{float(v):.2f}%"
+
+def _format_number(v: Any) -> str:
+    return f"{float(v):.2f}"
+
+# Display formatters for sub-metric keys of multi-value results; keys ending in
+# '_rate' default to percentages and everything else to _format_number
+_FORMATTERS: Dict[str, Callable[[Any], str]] = {
+    # FRED reports debt and the deficit in millions and GDP in billions
+    'govt_debt': lambda v: f"${float(v)/1000000:.2f} trillion",
+    'govt_deficit': lambda v: f"${abs(float(v))/1000:.2f} billion {'deficit' if float(v) < 0 else 'surplus'}",
+    'gdp': lambda v: f"${float(v)/1000:.2f} trillion",
+    'debt_to_gdp': _format_percent,
+    'gdp_growth': _format_percent,
+    'baa_spread': lambda v: f"{float(v):.2f}% ({int(float(v)*100)} bps)",
+}
+
+# Result keys shown as columns or in the headline row rather than as their own rows
+_DISPLAY_SKIP_KEYS = frozenset({'timestamp', 'source', 'date', 'growth_rate'})
+
 def display_metric_result(metric_name: str, value: Dict[str, Any]):
-    console = Console()
+    console = _CONSOLE
     
-    table = Table(show_header=True, header_style="bold magenta")
-    table.add_column("Metric", style="cyan")
-    table.add_column("Value", style="green")
-    table.add_column("As of Date", style="yellow")
-    table.add_column("Source", style="blue")
+    table = Table(show_header=True, header_style=RESULT_HEADER_STYLE)
+    for title, style in RESULT_COLUMNS:
+        table.add_column(title, style=style)
     
-    timestamp = value.pop('timestamp') if 'timestamp' in value else 'Date not available'
-    source = value.pop('source') if 'source' in value else 'Source not available'
+    # Read without modifying the result, which the caller may still be using
+    timestamp = value.get('timestamp', 'Date not available')
+    source = value.get('source', 'Source not available')
+    items = [(k, v) for k, v in value.items() if k not in _DISPLAY_SKIP_KEYS]
     
     # Special handling for equity risk premium which might have a date field
-    if 'date' in value and metric_name == 'US Equity Risk Premium':
-        date_value = value.pop('date')
+    if metric_name == 'US Equity Risk Premium':
+        date_value = value.get('date')
         if date_value and timestamp == 'Date not available':
             timestamp = date_value
     
     # Special handling for earnings growth
     if metric_name == 'US Earnings Growth' and 'growth_rate' in value:
-        growth_rate = value.pop('growth_rate')
+        growth_rate = value['growth_rate']
         if growth_rate is None:
             table.add_row(metric_name, "Data unavailable", timestamp, source)
         else:
             table.add_row(metric_name, f"{float(growth_rate):.2f}%", timestamp, source)
         
         # Add additional details if needed
-        for k, v in value.items():
-            if k not in ['timestamp', 'source', 'date']:
-                if v is None:
-                    table.add_row(k, "Data unavailable", timestamp, source)
-                else:
-                    try:
-                        formatted_value = f"{float(v):.2f}"
-                        if k.endswith('_date'):
-                            formatted_value = str(v)
-                        table.add_row(k, formatted_value, timestamp, source)
-                    except (ValueError, TypeError):
-                        table.add_row(k, str(v), timestamp, source)
-    elif len(value) == 1 and 'value' in value:
+        for k, v in items:
+            if v is None:
+                table.add_row(k, "Data unavailable", timestamp, source)
+            else:
+                try:
+                    formatted_value = f"{float(v):.2f}"
+                    if k.endswith('_date'):
+                        formatted_value = str(v)
+                    table.add_row(k, formatted_value, timestamp, source)
+                except (ValueError, TypeError):
+                    table.add_row(k, str(v), timestamp, source)
+    elif len(items) == 1 and 'value' in value:
         # Single metric
         if value['value'] is None:
             table.add_row(metric_name, "Data unavailable", timestamp, source)
@@ -1075,60 +1521,49 @@ def display_metric_result(metric_name: str, value: Dict[str, Any]):
                 table.add_row(metric_name, str(value['value']), timestamp, source)
     else:
         # Multiple metrics
-        for k, v in value.items():
-            if k not in ['timestamp', 'source', 'date', 'growth_rate']:
-                if v is None:
-                    table.add_row(k, "Data unavailable", timestamp, source)
-                else:
-                    try:
-                        # Format based on metric type
-                        if k == 'govt_debt':
-                            # Format in trillions for readability
-                            formatted_value = f"${float(v)/1000000:.2f} trillion"
-                        elif k == 'govt_deficit':
-                            # Format in billions with sign
-                            formatted_value = f"${abs(float(v))/1000:.2f} billion {'deficit' if float(v) < 0 else 'surplus'}"
-                        elif k == 'gdp':
-                            # Format in trillions
-                            formatted_value = f"${float(v)/1000:.2f} trillion"
-                        elif k == 'debt_to_gdp' or k == 'gdp_growth' or k.endswith('_rate'):
-                            # Percentages
-                            formatted_value = f"{float(v):.2f}%"
-                        elif k == 'baa_spread':
-                            # Basis points
-                            formatted_value = f"{float(v):.2f}% ({int(float(v)*100)} bps)"
-                        else:
-                            # Default formatting
-                            formatted_value = f"{float(v):.2f}"
-                    except (ValueError, TypeError):
-                        # If we can't format as float, just display as is
-                        formatted_value = str(v)
-                    
-                    table.add_row(k, formatted_value, timestamp, source)
+        for k, v in items:
+            if v is None:
+                table.add_row(k, "Data unavailable", timestamp, source)
+            else:
+                # Format based on metric type
+                formatter = _FORMATTERS.get(k) or (_format_percent if k.endswith('_rate') else _format_number)
+                try:
+                    formatted_value = formatter(v)
+                except (ValueError, TypeError):
+                    # If we can't format as float, just display as is
+                    formatted_value = str(v)
+                
+                table.add_row(k, formatted_value, timestamp, source)
     
     console.print(Panel(table, title=f"[bold cyan]{metric_name}[/bold cyan]", 
                       border_style="blue"))
 
 def export_all_metrics_to_csv(metrics: USMarketMetrics, csv_path: str) -> None:
     """Export all metrics to a CSV file"""
-    console = Console()
+    console = _CONSOLE
     
     with console.status("[bold cyan]Exporting all metrics to CSV...[/bold cyan]", spinner="dots"):
         try:
-            # Create a new metrics object with CSV export enabled
-            export_metrics = USMarketMetrics(
-                fred_api_key=os.getenv('FRED_API_KEY'),
-                csv_export_path=csv_path
-            )
-            
             # Get all metrics using the defined metric list
-            metric_names = [name for name in export_metrics.get_metric_definitions().keys() 
+            metric_names = [name for name in metrics.get_metric_definitions().keys() 
                           if name != 'US All Metrics']
             
-            for metric_name in metric_names:
-                console.print(f"[cyan]Fetching {metric_name}...[/cyan]")
-                export_metrics.get_metric_by_name(metric_name)
+            # Reuse the caller's instance (and its clients and caches), exporting to csv_path;
+            # leaving the block flushes the rows before we report success
+            with metrics.csv_export(csv_path):
+                console.print(f"[cyan]Fetching {len(metric_names)} metrics...[/cyan]")
+                metrics.prefetch()
                 
+                # Fetch the metrics concurrently, then write every row in one pass
+                results = []
+                fetch = functools.partial(metrics.get_metric_by_name, export=False)
+                with ThreadPoolExecutor(max_workers=8) as executor:
+                    for metric_name, result in zip(metric_names, executor.map(fetch, metric_names)):
+                        console.print(f"[cyan]Fetched {metric_name}[/cyan]")
+                        results.append((metric_name, result))
+                
+                metrics.export_results_to_csv(results, bulk=True)
+            
             console.print(f"[bold green]Successfully exported all metrics to {csv_path}[/bold green]")
             
         except Exception as e:
@@ -1136,7 +1571,7 @@ def export_all_metrics_to_csv(metrics: USMarketMetrics, csv_path: str) -> None:
 
 def display_menu():
     """Display the menu of available metrics"""
-    console = Console()
+    console = _CONSOLE
     
     menu_table = Table(show_header=False, box=None)
     menu_table.add_column("Option", style="cyan")
@@ -1164,18 +1599,68 @@ def get_user_choice() -> str:
                 
             choice_num = int(choice)
             
-            if 1 <= choice_num <= 18:
-                # Convert number to menu text
-                choices = get_metric_choices()
-                for menu_item in choices:
-                    if menu_item.startswith(f"{choice_num}. "):
-                        return menu_item.split('. ', 1)[1]
+            # Convert number to menu text
+            if choice_num in _CHOICE_MAP:
+                return _CHOICE_MAP[choice_num]
                         
-            print("[bold red]Invalid choice. Please enter a number between 1 and 18 or 'q' to exit.[/bold red]")
+            print(f"[bold red]Invalid choice. Please enter a number between 1 and {len(_CHOICE_MAP)} or 'q' to exit.[/bold red]")
         except ValueError:
             print("[bold red]Please enter a valid number or 'q' to exit.[/bold red]")
 
+def _is_date_or_blank(text: str) -> Union[bool, str]:
+    """questionary validator accepting an empty answer or a YYYY-MM-DD date"""
+    if not text:
+        return True
+    try:
+        datetime.strptime(text, '%Y-%m-%d')
+        return True
+    except ValueError:
+        return "Please enter a date as YYYY-MM-DD"
+
+# Date range, title and optional save path chosen for a plot
+PlotOptions = collections.namedtuple('PlotOptions', 'start_date end_date title save_path')
+
+def _prompt_plot_options(default_title: str, default_save_prefix: str) -> PlotOptions:
+    """
+    Ask for the options shared by both plot menu entries
+    
+    Args:
+        default_title: Title used when the user leaves it blank
+        default_save_prefix: File name prefix of the default save path
+        
+    Returns:
+        The chosen PlotOptions; save_path is None if the plot should not be saved
+    """
+    import questionary
+    
+    # Ask for date range; parsed here once so the plotting code works with datetimes
+    default_start = (datetime.now() - timedelta(days=365*5)).strftime('%Y-%m-%d')
+    start_date = questionary.text(f"Enter start date (YYYY-MM-DD) [default: {default_start}]:",
+                                  validate=_is_date_or_blank).ask()
+    start_date = datetime.strptime(start_date if start_date else default_start, '%Y-%m-%d')
+    
+    end_date = questionary.text("Enter end date (YYYY-MM-DD) [default: today]:",
+                                validate=_is_date_or_blank).ask()
+    end_date = datetime.strptime(end_date, '%Y-%m-%d') if end_date else datetime.now()
+    
+    # Ask for title
+    title = questionary.text(f"Enter plot title [default: {default_title}]:").ask()
+    title = title if title else default_title
+    
+    # Ask if user wants to save the plot
+    save_plot = questionary.confirm("Do you want to save the plot?").ask()
+    save_path = None
+    if save_plot:
+        default_save_path = f"{default_save_prefix}_{datetime.now().strftime('%Y%m%d')}.png"
+        save_path = questionary.text(f"Enter save path [default: {default_save_path}]:").ask()
+        save_path = save_path if save_path else default_save_path
+    
+    return PlotOptions(start_date, end_date, title, save_path)
+
 def main():
+    # Only the interactive prompts need questionary, so keep it off the import path
+    import questionary
+    
     # Get FRED API key from environment variable
     fred_api_key = os.getenv('FRED_API_KEY')
     
@@ -1185,7 +1670,7 @@ def main():
     
     # Initialize metrics without CSV export initially
     metrics = USMarketMetrics(fred_api_key)
-    console = Console()
+    console = _CONSOLE
     csv_path = None
 
     while True:
@@ -1207,6 +1692,8 @@ def main():
             csv_path = user_path if user_path else default_path
             
             export_all_metrics_to_csv(metrics, csv_path)
+            # The export fetched fresh data, so don't keep serving older results
+            metrics.invalidate()
             console.print("\n[cyan]Press Enter to continue...[/cyan]", end="")
             input()
             continue
@@ -1214,28 +1701,8 @@ def main():
             # Ask for series ID
             series_id = questionary.text("Enter FRED series ID (e.g., GDP, CPIAUCSL, DGS10):").ask()
             
-            # Ask for date range
-            default_start = (datetime.now() - timedelta(days=365*5)).strftime('%Y-%m-%d')
-            start_date = questionary.text(f"Enter start date (YYYY-MM-DD) [default: {default_start}]:").ask()
-            start_date = start_date if start_date else default_start
-            
-            end_date = questionary.text("Enter end date (YYYY-MM-DD) [default: today]:").ask()
-            end_date = end_date if end_date else datetime.now().strftime('%Y-%m-%d')
-            
-            # Ask for title
-            title = questionary.text(f"Enter plot title [default: {series_id} Historical Data]:").ask()
-            title = title if title else f"{series_id} Historical Data"
-            
-            # Ask if user wants to save the plot
-            save_plot = questionary.confirm("Do you want to save the plot?").ask()
-            save_path = None
-            if save_plot:
-                default_save_path = f"{series_id}_{datetime.now().strftime('%Y%m%d')}.png"
-                save_path = questionary.text(f"Enter save path [default: {default_save_path}]:").ask()
-                save_path = save_path if save_path else default_save_path
-            
-            # Plot the data
-            metrics.plot_series(series_id, title, start_date, end_date, save_path)
+            options = _prompt_plot_options(f"{series_id} Historical Data", series_id)
+            metrics.plot_series(series_id, options.title, options.start_date, options.end_date, options.save_path)
             
             console.print("\n[cyan]Press Enter to continue...[/cyan]", end="")
             input()
@@ -1253,28 +1720,9 @@ def main():
             if len(labels) < len(series_ids):
                 labels.extend([f"Series {i+1}" for i in range(len(labels), len(series_ids))])
             
-            # Ask for date range
-            default_start = (datetime.now() - timedelta(days=365*5)).strftime('%Y-%m-%d')
-            start_date = questionary.text(f"Enter start date (YYYY-MM-DD) [default: {default_start}]:").ask()
-            start_date = start_date if start_date else default_start
-            
-            end_date = questionary.text("Enter end date (YYYY-MM-DD) [default: today]:").ask()
-            end_date = end_date if end_date else datetime.now().strftime('%Y-%m-%d')
-            
-            # Ask for title
-            title = questionary.text("Enter plot title [default: FRED Data Comparison]:").ask()
-            title = title if title else "FRED Data Comparison"
-            
-            # Ask if user wants to save the plot
-            save_plot = questionary.confirm("Do you want to save the plot?").ask()
-            save_path = None
-            if save_plot:
-                default_save_path = f"fred_comparison_{datetime.now().strftime('%Y%m%d')}.png"
-                save_path = questionary.text(f"Enter save path [default: {default_save_path}]:").ask()
-                save_path = save_path if save_path else default_save_path
-            
-            # Plot the data
-            metrics.plot_multiple_series(series_ids, labels, title, start_date, end_date, save_path)
+            options = _prompt_plot_options("FRED Data Comparison", "fred_comparison")
+            metrics.plot_multiple_series(series_ids, labels, options.title, options.start_date,
+                                         options.end_date, options.save_path)
             
             console.print("\n[cyan]Press Enter to continue...[/cyan]", end="")
             input()